@@ -10,6 +10,18 @@ from core.base_abstractions.task import TaskSampler
 from utils.experiment_utils import TrainingPipeline
 
 
+_ALLOWED_CLASS_LEVEL_ATTRS = frozenset(
+    {
+        "__abstractmethods__",
+        "_abc_impl",
+        "_abc_registry",
+        "_abc_cache",
+        "_abc_negative_cache",
+        "_abc_negative_cache_version",
+    }
+)
+
+
 class FrozenClassVariables(abc.ABCMeta):
     """Metaclass for ExperimentConfig.
 
@@ -19,9 +31,7 @@ class FrozenClassVariables(abc.ABCMeta):
     """
 
     def __setattr__(cls, attr, value):
-        if isinstance(cls, type) and (
-            attr != "__abstractmethods__" and not attr.startswith("_abc_")
-        ):
+        if attr not in _ALLOWED_CLASS_LEVEL_ATTRS:
             raise RuntimeError(
                 "Cannot edit class-level attributes.\n"
                 "Changing the values of class-level attributes is disabled in ExperimentConfig classes.\n"
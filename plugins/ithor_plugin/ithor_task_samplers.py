@@ -1,6 +1,6 @@
-import copy
 import random
-from typing import List, Dict, Optional, Any, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Union, Tuple
 
 import gym
 
@@ -11,44 +11,109 @@ from core.base_abstractions.task import TaskSampler
 from utils.experiment_utils import set_deterministic_cudnn, set_seed
 from utils.system import get_logger
 
+_PERIOD_RANDOM = 0
+_PERIOD_MANUAL = 1
+_PERIOD_FIXED = 2
+
+_SAMPLER_CONFIG_REGISTRY: Dict[str, Dict[str, Any]] = {}
+
+
+def register_sampler_config(
+    key: str,
+    env_args: Dict[str, Any],
+    sensors: List[Sensor],
+    action_space: gym.Space,
+) -> None:
+    """Register configuration shared by all samplers of an experiment.
+
+    Samplers constructed with `config_key=key` reference these objects
+    instead of receiving their own copies. Registrations are per process:
+    with the default `forkserver` (or `spawn`) start method, sampler worker
+    processes only see registrations made when the experiment config module
+    is imported, not ones made later at runtime in the main process.
+    """
+    _SAMPLER_CONFIG_REGISTRY[key] = dict(
+        env_args=env_args, sensors=sensors, action_space=action_space
+    )
+
+
+def get_sampler_config(key: str) -> Dict[str, Any]:
+    if key not in _SAMPLER_CONFIG_REGISTRY:
+        raise KeyError("No sampler configuration registered under key {}.".format(key))
+    return _SAMPLER_CONFIG_REGISTRY[key]
+
 
 class ObjectNavTaskSampler(TaskSampler):
     def __init__(
         self,
         scenes: List[str],
         object_types: str,
-        sensors: List[Sensor],
-        max_steps: int,
-        env_args: Dict[str, Any],
-        action_space: gym.Space,
+        sensors: Optional[List[Sensor]] = None,
+        max_steps: Optional[int] = None,
+        env_args: Optional[Dict[str, Any]] = None,
+        action_space: Optional[gym.Space] = None,
         scene_period: Optional[Union[int, str]] = None,
         max_tasks: Optional[int] = None,
         seed: Optional[int] = None,
         deterministic_cudnn: bool = False,
         fixed_tasks: Optional[List[Dict[str, Any]]] = None,
         *args,
+        config_key: Optional[str] = None,
+        async_env_creation: bool = False,
         **kwargs
     ) -> None:
+        if config_key is not None:
+            if env_args is not None or sensors is not None or action_space is not None:
+                raise ValueError(
+                    "`env_args`, `sensors` and `action_space` cannot be given"
+                    " together with `config_key`."
+                )
+            config = get_sampler_config(config_key)
+            env_args = config["env_args"]
+            sensors = config["sensors"]
+            action_space = config["action_space"]
+        if env_args is None or sensors is None or action_space is None:
+            raise ValueError(
+                "Either `config_key` or all of `env_args`, `sensors` and"
+                " `action_space` must be given."
+            )
+        if max_steps is None:
+            raise ValueError("`max_steps` must be given.")
+
         self.env_args = env_args
         self.scenes = scenes
         self.object_types = object_types
+        self._object_types_tuple = tuple(self.object_types)
+        self._scene_object_types_cache: Dict[str, Tuple[str, ...]] = {}
         self.grid_size = 0.25
         self.env: Optional[IThorEnvironment] = None
+        self._current_scene_norm: Optional[str] = None
         self.sensors = sensors
         self.max_steps = max_steps
         self._action_space = action_space
 
         self.scene_counter: Optional[int] = None
-        self.scene_order: Optional[List[str]] = None
+        self._scenes_norm: Optional[List[str]] = None
+        self.scene_order: Optional[List[int]] = None
         self.scene_id: Optional[int] = None
         self.scene_period: Optional[
             Union[str, int]
         ] = scene_period  # default makes a random choice
+        if scene_period is None:
+            self._period_mode = _PERIOD_RANDOM
+        elif scene_period == "manual":
+            self._period_mode = _PERIOD_MANUAL
+        elif isinstance(scene_period, int):
+            self._period_mode = _PERIOD_FIXED
+        else:
+            raise NotImplementedError("Invalid scene_period {}".format(scene_period))
+        self._period_int = scene_period if self._period_mode == _PERIOD_FIXED else 0
         self.max_tasks: Optional[int] = None
         self.reset_tasks = max_tasks
 
         self._last_sampled_task: Optional[ObjectNavTask] = None
 
+        self._rng = random.Random()
         self.seed: Optional[int] = None
         self.set_seed(seed)
 
@@ -57,6 +122,14 @@ class ObjectNavTaskSampler(TaskSampler):
 
         self.reset()
 
+        # Optionally start the (slow) Unity process in the background so that it
+        # overlaps with the rest of the trainer's setup
+        self._env_future: Optional[Future] = None
+        if async_env_creation:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._env_future = executor.submit(self._create_environment)
+            executor.shutdown(wait=False)
+
     def _create_environment(self) -> IThorEnvironment:
         env = IThorEnvironment(
             make_agents_visible=False,
@@ -66,6 +139,13 @@ class ObjectNavTaskSampler(TaskSampler):
         )
         return env
 
+    def _get_environment(self) -> IThorEnvironment:
+        if self._env_future is None:
+            return self._create_environment()
+        env = self._env_future.result()
+        self._env_future = None
+        return env
+
     @property
     def length(self) -> Union[int, float]:
         """Length.
@@ -85,6 +165,8 @@ class ObjectNavTaskSampler(TaskSampler):
         return self._last_sampled_task
 
     def close(self) -> None:
+        if self.env is None and self._env_future is not None:
+            self.env = self._get_environment()
         if self.env is not None:
             self.env.stop()
 
@@ -101,7 +183,7 @@ class ObjectNavTaskSampler(TaskSampler):
 
     def sample_scene(self, force_advance_scene: bool):
         if force_advance_scene:
-            if self.scene_period != "manual":
+            if self._period_mode != _PERIOD_MANUAL:
                 get_logger().warning(
                     "When sampling scene, have `force_advance_scene == True`"
                     "but `self.scene_period` is not equal to 'manual',"
@@ -109,17 +191,18 @@ class ObjectNavTaskSampler(TaskSampler):
                 )
             self.scene_id = (1 + self.scene_id) % len(self.scenes)
             if self.scene_id == 0:
-                random.shuffle(self.scene_order)
+                self._rng.shuffle(self.scene_order)
 
-        if self.scene_period is None:
+        mode = self._period_mode
+        if mode == _PERIOD_RANDOM:
             # Random scene
-            self.scene_id = random.randint(0, len(self.scenes) - 1)
-        elif self.scene_period == "manual":
+            self.scene_id = self._rng.randint(0, len(self.scenes) - 1)
+        elif mode == _PERIOD_MANUAL:
             pass
-        elif self.scene_counter == self.scene_period:
+        elif self.scene_counter == self._period_int:
             if self.scene_id == len(self.scene_order) - 1:
                 # Randomize scene order for next iteration
-                random.shuffle(self.scene_order)
+                self._rng.shuffle(self.scene_order)
                 # Move to next scene
                 self.scene_id = 0
             else:
@@ -127,18 +210,14 @@ class ObjectNavTaskSampler(TaskSampler):
                 self.scene_id += 1
             # Reset scene counter
             self.scene_counter = 1
-        elif isinstance(self.scene_period, int):
+        else:
             # Stay in current scene
             self.scene_counter += 1
-        else:
-            raise NotImplementedError(
-                "Invalid scene_period {}".format(self.scene_period)
-            )
 
         if self.max_tasks is not None:
             self.max_tasks -= 1
 
-        return self.scenes[int(self.scene_order[self.scene_id])]
+        return self.scenes[self.scene_order[self.scene_id]]
 
     def next_task(self, force_advance_scene: bool = False) -> Optional[ObjectNavTask]:
         if self.max_tasks is not None and self.max_tasks <= 0:
@@ -146,26 +225,31 @@ class ObjectNavTaskSampler(TaskSampler):
 
         scene = self.sample_scene(force_advance_scene)
 
+        scene_norm = self._scenes_norm[self.scene_order[self.scene_id]]
         if self.env is not None:
-            if scene.replace("_physics", "") != self.env.scene_name.replace(
-                "_physics", ""
-            ):
+            if scene_norm != self._current_scene_norm:
                 self.env.reset(scene)
         else:
-            self.env = self._create_environment()
+            self.env = self._get_environment()
             self.env.reset(scene_name=scene)
+        self._current_scene_norm = scene_norm
 
         pose = self.env.randomize_agent_location()
 
-        object_types_in_scene = set(
-            [o["objectType"] for o in self.env.last_event.metadata["objects"]]
-        )
+        candidates = self._scene_object_types_cache.get(scene)
+        if candidates is None:
+            object_types_in_scene = {
+                o["objectType"] for o in self.env.last_event.metadata["objects"]
+            }
+            # Keep `object_types` order so sampling does not depend on the hash seed
+            candidates = tuple(
+                ot for ot in self._object_types_tuple if ot in object_types_in_scene
+            )
+            self._scene_object_types_cache[scene] = candidates
 
         task_info: Dict[str, Any] = {}
-        for ot in random.sample(self.object_types, len(self.object_types)):
-            if ot in object_types_in_scene:
-                task_info["object_type"] = ot
-                break
+        if candidates:
+            task_info["object_type"] = self._rng.choice(candidates)
 
         if len(task_info) == 0:
             get_logger().warning(
@@ -173,7 +257,7 @@ class ObjectNavTaskSampler(TaskSampler):
                 " objects of any of the types {}.".format(scene, self.object_types)
             )
 
-        task_info["start_pose"] = copy.copy(pose)
+        task_info["start_pose"] = dict(pose)
 
         self._last_sampled_task = ObjectNavTask(
             env=self.env,
@@ -185,9 +269,10 @@ class ObjectNavTaskSampler(TaskSampler):
         return self._last_sampled_task
 
     def reset(self):
+        self._scenes_norm = [s.replace("_physics", "") for s in self.scenes]
         self.scene_counter = 0
         self.scene_order = list(range(len(self.scenes)))
-        random.shuffle(self.scene_order)
+        self._rng.shuffle(self.scene_order)
         self.scene_id = 0
         self.max_tasks = self.reset_tasks
 
@@ -195,3 +280,7 @@ class ObjectNavTaskSampler(TaskSampler):
         self.seed = seed
         if seed is not None:
             set_seed(seed)
+            # Derive a distinct seed so the sampler's stream is not a copy of the
+            # global `random` stream used by the environment (str seeds are hashed
+            # with sha512, so this does not depend on PYTHONHASHSEED)
+            self._rng.seed("ithor_sampler_{}".format(seed))
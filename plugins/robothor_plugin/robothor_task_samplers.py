@@ -196,9 +196,9 @@ class ObjectNavTaskSampler(TaskSampler):
 
             pose = self.env.randomize_agent_location()
 
-            object_types_in_scene = set(
-                [o["objectType"] for o in self.env.last_event.metadata["objects"]]
-            )
+            object_types_in_scene = {
+                o["objectType"] for o in self.env.last_event.metadata["objects"]
+            }
 
             task_info = {"scene": scene}
             for ot in random.sample(self.object_types, len(self.object_types)):
@@ -20,6 +20,7 @@ from projects.objectnav_baselines.models.object_nav_models import (
     ObjectNavBaselineActorCritic,
 )
 from utils.experiment_utils import Builder, PipelineStage, TrainingPipeline, LinearDecay
+from utils.misc_utils import partition_sequence_by_weight
 
 
 class ObjectNavThorPPOExperimentConfig(ExperimentConfig):
@@ -55,6 +56,11 @@ class ObjectNavThorPPOExperimentConfig(ExperimentConfig):
     VALID_SAMPLES_IN_SCENE = 10
     TEST_SAMPLES_IN_SCENE = 100
 
+    # Optional expected cost (e.g. reset/step time) per scene; when given, scenes
+    # are split across processes so that each gets a similar total cost. Scenes
+    # missing from the mapping count as 1.0.
+    SCENE_WEIGHTS: Optional[Dict[str, float]] = None
+
     @classmethod
     def tag(cls):
         return "ObjectNavThorPPO"
@@ -157,10 +163,18 @@ class ObjectNavThorPPOExperimentConfig(ExperimentConfig):
                     "Warning: oversampling some of the scenes to feed all processes."
                     " You can avoid this by setting a number of workers divisor of the number of scenes"
                 )
-        inds = self._partition_inds(len(scenes), total_processes)
+        if self.SCENE_WEIGHTS is not None:
+            process_scenes = partition_sequence_by_weight(
+                scenes,
+                [self.SCENE_WEIGHTS.get(scene, 1.0) for scene in scenes],
+                total_processes,
+            )[process_ind]
+        else:
+            inds = self._partition_inds(len(scenes), total_processes)
+            process_scenes = scenes[inds[process_ind] : inds[process_ind + 1]]
 
         return {
-            "scenes": scenes[inds[process_ind] : inds[process_ind + 1]],
+            "scenes": process_scenes,
             "object_types": self.OBJECT_TYPES,
             "env_args": self.ENV_ARGS,
             "max_steps": self.MAX_STEPS,
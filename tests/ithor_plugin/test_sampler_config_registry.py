@@ -0,0 +1,78 @@
+import gym
+
+from plugins.ithor_plugin.ithor_task_samplers import (
+    ObjectNavTaskSampler,
+    get_sampler_config,
+    register_sampler_config,
+)
+
+
+class TestSamplerConfigRegistry(object):
+    def test_register_and_get(self):
+        env_args = {"player_screen_width": 224}
+        sensors = []
+        action_space = gym.spaces.Discrete(6)
+
+        register_sampler_config(
+            "test_register_and_get", env_args, sensors, action_space
+        )
+
+        config = get_sampler_config("test_register_and_get")
+        assert config["env_args"] is env_args
+        assert config["sensors"] is sensors
+        assert config["action_space"] is action_space
+
+        failed = False
+        try:
+            get_sampler_config("test_unregistered_key")
+        except KeyError:
+            failed = True
+        assert failed
+
+    def test_sampler_uses_registered_config(self):
+        env_args = {"player_screen_width": 224}
+        sensors = []
+        action_space = gym.spaces.Discrete(6)
+        register_sampler_config("test_sampler_uses", env_args, sensors, action_space)
+
+        # The environment is only created on the first `next_task` call
+        sampler = ObjectNavTaskSampler(
+            scenes=["FloorPlan1"],
+            object_types=["Apple"],
+            max_steps=10,
+            config_key="test_sampler_uses",
+        )
+        assert sampler.env_args is env_args
+        assert sampler.sensors is sensors
+        assert sampler._action_space is action_space
+
+    def test_sampler_rejects_ambiguous_config(self):
+        register_sampler_config("test_sampler_rejects", {}, [], gym.spaces.Discrete(6))
+
+        failed = False
+        try:
+            ObjectNavTaskSampler(
+                scenes=["FloorPlan1"],
+                object_types=["Apple"],
+                max_steps=10,
+                sensors=[],
+                config_key="test_sampler_rejects",
+            )
+        except ValueError:
+            failed = True
+        assert failed
+
+        failed = False
+        try:
+            ObjectNavTaskSampler(
+                scenes=["FloorPlan1"], object_types=["Apple"], max_steps=10
+            )
+        except ValueError:
+            failed = True
+        assert failed
+
+
+if __name__ == "__main__":
+    TestSamplerConfigRegistry().test_register_and_get()  # type:ignore
+    TestSamplerConfigRegistry().test_sampler_uses_registered_config()  # type:ignore
+    TestSamplerConfigRegistry().test_sampler_rejects_ambiguous_config()  # type:ignore
@@ -0,0 +1,62 @@
+from math import ceil
+
+from utils.misc_utils import partition_sequence_by_weight
+
+
+class TestPartitionSequenceByWeight(object):
+    def test_balanced_loads(self):
+        items = ["a", "b", "c", "d", "e", "f"]
+        weights = [5.0, 4.0, 3.0, 3.0, 2.0, 1.0]
+        w = dict(zip(items, weights))
+
+        parts = partition_sequence_by_weight(items, weights, 2)
+
+        assert len(parts) == 2
+        assert sorted(sum(parts, [])) == items
+        loads = [sum(w[it] for it in part) for part in parts]
+        assert loads == [9.0, 9.0]
+
+    def test_heavy_item_isolated(self):
+        parts = partition_sequence_by_weight(
+            ["a", "b", "c", "d", "e"], [10.0, 1.0, 1.0, 1.0, 1.0], 2
+        )
+        assert parts == [["a"], ["b", "c", "d", "e"]]
+
+    def test_order_kept_within_parts(self):
+        items = list(range(10))
+        weights = [1.0, 7.0, 3.0, 9.0, 2.0, 8.0, 4.0, 6.0, 5.0, 0.5]
+
+        for num_parts in [1, 2, 3, 4]:
+            parts = partition_sequence_by_weight(items, weights, num_parts)
+            assert len(parts) == num_parts
+            for part in parts:
+                assert part == sorted(part)
+            assert sorted(sum(parts, [])) == items
+
+    def test_more_processes_than_scenes(self):
+        scenes = ["a", "b", "c"]
+        w = {"a": 3.0, "b": 2.0, "c": 1.0}
+        total_processes = 5
+
+        # Callers oversample scenes to feed all processes
+        oversampled = scenes * int(ceil(total_processes / len(scenes)))
+        for inputs in [
+            oversampled,
+            oversampled[: total_processes * (len(oversampled) // total_processes)],
+        ]:
+            parts = partition_sequence_by_weight(
+                inputs, [w[scene] for scene in inputs], total_processes
+            )
+
+            assert len(parts) == total_processes
+            assert sorted(sum(parts, [])) == sorted(inputs)
+            for part in parts:
+                assert len(part) > 0
+                assert len(set(part)) == len(part)
+
+
+if __name__ == "__main__":
+    TestPartitionSequenceByWeight().test_balanced_loads()  # type:ignore
+    TestPartitionSequenceByWeight().test_heavy_item_isolated()  # type:ignore
+    TestPartitionSequenceByWeight().test_order_kept_within_parts()  # type:ignore
+    TestPartitionSequenceByWeight().test_more_processes_than_scenes()  # type:ignore
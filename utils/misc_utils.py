@@ -102,6 +102,36 @@ def uninterleave(input: Sequence, parts: int) -> List:
     ]
 
 
+def partition_sequence_by_weight(
+    input: Sequence, weights: Sequence[float], parts: int
+) -> List:
+    """Greedily partition `input` into `parts` lists of similar total weight.
+
+    Items are taken in order of decreasing weight and each is assigned to
+    the part with the smallest current total (longest-processing-time
+    scheduling), preferring parts that do not already contain an equal item
+    so that repeated (oversampled) items are spread over different parts.
+    Within a part, items keep their relative order in `input`.
+    """
+    assert 0 < parts <= len(input)
+    assert len(weights) == len(input)
+
+    order = sorted(range(len(input)), key=lambda i: (-weights[i], i))
+    loads = [0.0] * parts
+    part_inds: List[List[int]] = [[] for _ in range(parts)]
+    for i in order:
+        free = [
+            part
+            for part in range(parts)
+            if all(input[j] != input[i] for j in part_inds[part])
+        ]
+        part = min(free or range(parts), key=lambda part: (loads[part], part))
+        part_inds[part].append(i)
+        loads[part] += weights[i]
+
+    return [[input[i] for i in sorted(inds)] for inds in part_inds]
+
+
 @lru_cache(10000)
 def cached_comb(n: int, m: int):
     return comb(n, m)